@@ -3,6 +3,15 @@
 import os
 import asciichartpy
 import json
+import math
+import bisect
+import csv
+import io
+import shlex
+import click
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.table import Table
 from rich import box
@@ -15,7 +24,40 @@
 # 2. ตั้งค่า App
 app = typer.Typer()
 console = Console()
+# ใช้ connection ร่วมกันทุกคำสั่ง (keep-alive) โดยเฉพาะตอนอยู่ใน shell
+# เฉพาะ main thread เท่านั้น; thread อื่นใช้ _worker_session()
+session = requests.Session()
+_thread_local = threading.local()
 WATCHLIST_FILE = Path("watchlist.json")
+NEWS_CATEGORIES = ["business", "entertainment", "general", "health", "science", "sports", "technology"]
+
+# ตั้งค่าสำหรับ shell (symbol directory + history)
+SYMBOLS_FILE = Path("symbols.json")
+SYMBOLS_TTL = 24 * 60 * 60        # วินาที
+HISTORY_FILE = Path.home() / ".investcli_history"
+
+# ตั้งค่าสำหรับ crypto top (สแกนตลาดทีละหน้า)
+COINGECKO_MARKETS_URL = "https://api.coingecko.com/api/v3/coins/markets"
+COINGECKO_MAX_PER_PAGE = 250      # per_page สูงสุดที่ CoinGecko รองรับ
+COINGECKO_MAX_WORKERS = 4         # จำนวนหน้าที่ดึงพร้อมกัน
+# วินาทีขั้นต่ำระหว่าง request: public API แบบไม่มี key ได้ราว 10 calls/min (ปรับได้ผ่าน .env)
+COINGECKO_MIN_INTERVAL = float(os.getenv("COINGECKO_MIN_INTERVAL", "6"))
+COINGECKO_MAX_RETRIES = 5         # จำนวนครั้งที่ลองใหม่เมื่อโดน 429
+COINGECKO_BACKOFF = 15.0          # วินาทีเริ่มต้นของ backoff (x2 ทุกครั้ง) ถ้าไม่มี Retry-After
+CRYPTO_TOP_MAX_N = 2500           # จำกัดไม่เกิน 10 หน้าต่อคำสั่ง
+CRYPTO_SNAPSHOT_FILE = Path("crypto_top.json")
+CRYPTO_SNAPSHOT_TTL = 300         # วินาที
+CRYPTO_SORT_KEYS = {
+    "market_cap": "market_cap",
+    "volume": "total_volume",
+    "change": "price_change_percentage_24h",
+}
+
+def _worker_session() -> requests.Session:
+    """Return a Session owned by the current worker thread (Session is not thread-safe)."""
+    if not hasattr(_thread_local, "session"):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
 
 def load_watchlist() -> list[str]:
     """Load watchlist symbols from local JSON file."""
@@ -39,6 +81,441 @@ def save_watchlist(symbols: list[str]) -> None:
     with WATCHLIST_FILE.open("w", encoding="utf-8") as f:
         json.dump(symbols, f, indent=2)
 
+def load_crypto_snapshot(n: int) -> tuple[list[dict], float] | None:
+    """Load the last complete top-N scan if it is fresh and large enough."""
+    if not CRYPTO_SNAPSHOT_FILE.exists():
+        return None
+
+    try:
+        with CRYPTO_SNAPSHOT_FILE.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        age = time.time() - float(data["fetched_at"])
+        coins = data["coins"]
+        if age > CRYPTO_SNAPSHOT_TTL or int(data["n"]) < n or not isinstance(coins, list):
+            return None
+        return coins[:n], age
+    except Exception:
+        # ถ้าไฟล์พัง/อ่านไม่ได้ ให้ดึงใหม่
+        return None
+
+def save_crypto_snapshot(n: int, coins: list[dict]) -> None:
+    """Save a complete top-N scan to local JSON file."""
+    with CRYPTO_SNAPSHOT_FILE.open("w", encoding="utf-8") as f:
+        json.dump({"fetched_at": time.time(), "n": n, "coins": coins}, f)
+
+# ตัวจำกัดความถี่ request ไปยัง CoinGecko (ใช้ร่วมกันทุก thread)
+_coingecko_lock = threading.Lock()
+_coingecko_next_call = 0.0
+_coingecko_blocked_until = 0.0
+
+def _coingecko_wait(cancel: threading.Event) -> None:
+    """Block until the shared CoinGecko rate limit allows another request."""
+    global _coingecko_next_call
+    while True:
+        with _coingecko_lock:
+            now = time.monotonic()
+            start = max(now, _coingecko_next_call, _coingecko_blocked_until)
+            _coingecko_next_call = start + COINGECKO_MIN_INTERVAL
+        # รอแบบยกเลิกได้ (Ctrl-C ระหว่างสแกน)
+        if cancel.wait(start - now):
+            raise RuntimeError("Scan cancelled")
+        # ถ้าระหว่างรอมี thread อื่นโดน 429 ให้จองคิวใหม่หลัง backoff
+        with _coingecko_lock:
+            if _coingecko_blocked_until <= time.monotonic():
+                return
+
+def _coingecko_backoff(resp: requests.Response, attempt: int) -> None:
+    """After a 429, hold back every worker until Retry-After (or an exponential delay)."""
+    global _coingecko_blocked_until
+    try:
+        delay = float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = COINGECKO_BACKOFF * 2 ** attempt
+    with _coingecko_lock:
+        _coingecko_blocked_until = max(_coingecko_blocked_until, time.monotonic() + delay)
+
+def coingecko_get(url: str, params: dict | None, cancel: threading.Event) -> requests.Response:
+    """GET a CoinGecko endpoint through the shared rate limiter, retrying on 429."""
+    for attempt in range(COINGECKO_MAX_RETRIES):
+        _coingecko_wait(cancel)
+        resp = _worker_session().get(url, params=params, timeout=15)
+        if resp.status_code == 429:
+            _coingecko_backoff(resp, attempt)
+            continue
+        resp.raise_for_status()
+        return resp
+
+    raise RuntimeError("CoinGecko rate limit hit")
+
+def fetch_market_page(page: int, per_page: int, cancel: threading.Event) -> list[dict]:
+    """Fetch one page of /coins/markets ordered by market cap."""
+    params = {
+        "vs_currency": "usd",
+        "order": "market_cap_desc",
+        "per_page": per_page,
+        "page": page,
+    }
+
+    data = coingecko_get(COINGECKO_MARKETS_URL, params, cancel).json()
+    if not isinstance(data, list):
+        # เช่น {"status": {"error_message": ...}} นับเป็นหน้าที่ล้มเหลว
+        raise RuntimeError(f"Unexpected response: {str(data)[:100]}")
+    # เก็บเฉพาะ field ที่ใช้ เพื่อให้ snapshot เล็ก
+    return [
+        {
+            "market_cap_rank": c.get("market_cap_rank"),
+            "name": c.get("name"),
+            "symbol": c.get("symbol"),
+            "current_price": c.get("current_price"),
+            "market_cap": c.get("market_cap"),
+            "total_volume": c.get("total_volume"),
+            "price_change_percentage_24h": c.get("price_change_percentage_24h"),
+        }
+        for c in data
+    ]
+
+# pool ของ worker ใช้ต่อเนื่องทั้ง process ให้ session (TLS) ของแต่ละ thread อุ่นอยู่ข้ามคำสั่งใน shell
+_scan_pool: ThreadPoolExecutor | None = None
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    """Return the long-lived executor used for CoinGecko page fetches."""
+    global _scan_pool
+    if _scan_pool is None:
+        _scan_pool = ThreadPoolExecutor(max_workers=COINGECKO_MAX_WORKERS, thread_name_prefix="coingecko")
+    return _scan_pool
+
+def crypto_top_pages(n: int) -> tuple[int, int]:
+    """Return (per_page, total_pages) needed to scan the top-n coins."""
+    per_page = min(n, COINGECKO_MAX_PER_PAGE)
+    return per_page, math.ceil(n / per_page)
+
+def scan_top_coins(n: int, on_page) -> tuple[list[dict], bool]:
+    """
+    Fetch the top-n coins by market cap, requesting pages concurrently.
+    Pages are handed to on_page(page, rows) in rank order as soon as they are
+    available; rows is None when that page failed.
+    Returns (coins, complete).
+    """
+    per_page, total_pages = crypto_top_pages(n)
+    results: dict[int, list[dict] | None] = {}
+    coins: list[dict] = []
+    complete = True
+    next_page = 1
+
+    cancel = threading.Event()
+    pool = _get_scan_pool()
+    futures = {}
+    finished = False
+    try:
+        futures = {
+            pool.submit(fetch_market_page, page, per_page, cancel): page
+            for page in range(1, total_pages + 1)
+        }
+        for future in as_completed(futures):
+            page = futures[future]
+            try:
+                results[page] = future.result()
+            except Exception as e:
+                console.print(f"[red]Page {page} failed: {e}[/red]")
+                results[page] = None
+                complete = False
+
+            # ส่งต่อหน้าที่เรียงลำดับครบแล้วออกไปแสดงผลทันที
+            while next_page in results:
+                rows = results.pop(next_page)
+                if rows is None:
+                    on_page(next_page, None)
+                else:
+                    rows = rows[: n - (next_page - 1) * per_page]
+                    coins.extend(rows)
+                    if rows:
+                        on_page(next_page, rows)
+                next_page += 1
+        finished = True
+    finally:
+        if not finished:
+            # Ctrl-C หรือ error อื่น: ยกเลิกหน้าที่เหลือ ไม่ต้องรอ rate limit จนครบ
+            cancel.set()
+            for future in futures:
+                future.cancel()
+
+    return coins, complete
+
+def _crypto_top_table(title: str | None = None, show_header: bool = True) -> Table:
+    """Build a fixed-width table so streamed chunks line up with each other."""
+    table = Table(title=title, show_header=show_header, box=box.SIMPLE, show_edge=False, pad_edge=False)
+    table.add_column("#", style="magenta", justify="right", width=5)
+    table.add_column("Name", style="white", width=14, no_wrap=True)
+    table.add_column("Symbol", style="cyan", width=8, no_wrap=True)
+    table.add_column("Price", style="yellow", justify="right", width=11, no_wrap=True)
+    table.add_column("Mkt Cap", justify="right", width=9, no_wrap=True)
+    table.add_column("Vol 24h", justify="right", width=9, no_wrap=True)
+    table.add_column("24h %", justify="right", width=8, no_wrap=True)
+    return table
+
+def _compact_usd(value: float | None) -> str:
+    """Format a large USD amount as e.g. $1.23B."""
+    if value is None:
+        return "N/A"
+    for unit, size in (("T", 1e12), ("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        # เทียบหลังปัดเศษ เช่น 999,996,000 -> $1.00B ไม่ใช่ $1,000.00M
+        if round(abs(value) / size, 2) >= 1:
+            return f"${value / size:,.2f}{unit}"
+    return f"${value:,.0f}"
+
+def _add_crypto_row(table: Table, idx: int, coin: dict) -> None:
+    """Append one /coins/markets row to a crypto top table."""
+    price = coin.get("current_price")
+    if price is None:
+        price_str = "N/A"
+    elif price >= 1:
+        price_str = f"${price:,.2f}"
+    else:
+        price_str = f"${price:.6g}"
+
+    change = coin.get("price_change_percentage_24h")
+    color = "green" if change is not None and change >= 0 else "red"
+    change_str = f"[{color}]{change:+.2f}%[/{color}]" if change is not None else "N/A"
+
+    table.add_row(
+        str(idx),
+        coin.get("name") or "-",
+        (coin.get("symbol") or "-").upper(),
+        price_str,
+        _compact_usd(coin.get("market_cap")),
+        _compact_usd(coin.get("total_volume")),
+        change_str,
+    )
+
+def show_crypto_top(n: int, sort: str, refresh: bool) -> None:
+    """Scan the top-n coins (or reuse the local snapshot) and print them sorted."""
+    sort = sort.lower()
+    if sort not in CRYPTO_SORT_KEYS:
+        console.print(f"[red]❌ Error: '{sort}' is not a valid sort.[/red]")
+        console.print(f"[yellow]💡 Available sorts are: {', '.join(CRYPTO_SORT_KEYS)}[/yellow]")
+        return
+    if not 1 <= n <= CRYPTO_TOP_MAX_N:
+        console.print(f"[red]Error: --n must be between 1 and {CRYPTO_TOP_MAX_N}.[/red]")
+        return
+
+    title = f"Top {n} Coins by Market Cap (sorted by {sort})"
+
+    def print_sorted(coins: list[dict]) -> None:
+        key = CRYPTO_SORT_KEYS[sort]
+        # ค่า None ไปอยู่ท้ายตาราง
+        ordered = sorted(coins, key=lambda c: (c.get(key) is None, -(c.get(key) or 0)))
+        table = _crypto_top_table(title)
+        for idx, coin in enumerate(ordered, 1):
+            _add_crypto_row(table, idx, coin)
+        console.print(table)
+
+    # ใช้ snapshot ในเครื่องถ้ายังไม่หมดอายุ
+    snapshot = None if refresh else load_crypto_snapshot(n)
+    if snapshot is not None:
+        coins, age = snapshot
+        console.print(f"[dim]Using local snapshot ({age:.0f}s old). Use --refresh to re-scan.[/dim]")
+        print_sorted(coins)
+        return
+
+    per_page, total_pages = crypto_top_pages(n)
+    console.print(f"[yellow]Scanning top {n} coins ({total_pages} page(s))...[/yellow]")
+
+    # เรียงตาม market cap อยู่แล้ว แสดงผลทีละหน้าได้เลย ส่วน sort อื่นต้องรอครบก่อน
+    stream = sort == "market_cap"
+    missing: list[str] = []
+    header_printed = False
+
+    def on_page(page: int, rows: list[dict] | None) -> None:
+        nonlocal header_printed
+        # อันดับอิงจากตำแหน่งหน้า ไม่ใช่จำนวนแถวที่พิมพ์ไปแล้ว
+        first_rank = (page - 1) * per_page + 1
+        if rows is None:
+            gap = f"#{first_rank}-{min(page * per_page, n)}"
+            missing.append(gap)
+            if stream:
+                console.print(f"[red]  ... {gap} missing (page {page} failed)[/red]")
+            return
+
+        if stream:
+            table = _crypto_top_table(title if not header_printed else None, show_header=not header_printed)
+            header_printed = True
+            for idx, coin in enumerate(rows, first_rank):
+                _add_crypto_row(table, idx, coin)
+            console.print(table)
+        else:
+            console.print(f"[dim]Fetched {len(rows)} coins...[/dim]")
+
+    try:
+        coins, complete = scan_top_coins(n, on_page)
+    except Exception as e:
+        console.print(f"[red]Error scanning market: {e}[/red]")
+        return
+
+    if not coins:
+        console.print("[red]No market data found.[/red]")
+        return
+
+    if complete:
+        save_crypto_snapshot(n, coins)
+    else:
+        console.print("[yellow]Scan incomplete; snapshot not saved.[/yellow]")
+
+    if not stream:
+        print_sorted(coins)
+        if missing:
+            console.print(f"[red]Missing market cap ranks: {', '.join(missing)}[/red]")
+    console.print("[dim]Source: CoinGecko API[/dim]\n")
+
+def fetch_stock_symbols() -> list[str]:
+    """Fetch all active US tickers from Alpha Vantage LISTING_STATUS (CSV)."""
+    api_key = os.getenv("ALPHA_VANTAGE_KEY")
+    if not api_key:
+        return []
+
+    resp = _worker_session().get("https://www.alphavantage.co/query", params={
+        "function": "LISTING_STATUS",
+        "apikey": api_key,
+    }, timeout=30)
+    resp.raise_for_status()
+    rows = csv.reader(io.StringIO(resp.text))
+    header = next(rows, [])
+    # ถ้าติด Limit จะได้ JSON กลับมาแทน CSV
+    if not header or header[0] != "symbol":
+        return []
+    return [row[0].upper() for row in rows if row]
+
+def fetch_coin_ids() -> list[str]:
+    """Fetch all coin ids from CoinGecko /coins/list."""
+    # ผ่าน rate limiter เดียวกับ crypto top เพราะใช้ quota ต่อ IP ร่วมกัน
+    data = coingecko_get("https://api.coingecko.com/api/v3/coins/list", None, threading.Event()).json()
+    if not isinstance(data, list):
+        return []
+    return [c["id"] for c in data if c.get("id")]
+
+def fetch_currency_codes() -> list[str]:
+    """Fetch physical currency codes from Alpha Vantage (CSV)."""
+    resp = _worker_session().get("https://www.alphavantage.co/physical_currency_list/", timeout=30)
+    resp.raise_for_status()
+    rows = csv.reader(io.StringIO(resp.text))
+    header = next(rows, [])
+    # กันหน้า error (HTML/JSON) ถูก cache เป็นรหัสสกุลเงิน
+    if not header or header[0] != "currency code":
+        return []
+    return [row[0].upper() for row in rows if row]
+
+SYMBOL_SOURCES = {
+    "stocks": fetch_stock_symbols,
+    "coins": fetch_coin_ids,
+    "currencies": fetch_currency_codes,
+}
+
+def load_symbol_directory() -> tuple[dict[str, list[str]], dict[str, float]]:
+    """
+    Load the cached symbol directory from local JSON file.
+    Returns (directory, fetched_at) where each list is sorted for prefix lookup
+    and fetched_at holds the time each source was last fetched successfully.
+    """
+    if not SYMBOLS_FILE.exists():
+        return {}, {}
+
+    try:
+        with SYMBOLS_FILE.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        directory = {}
+        fetched_at = {}
+        for kind in SYMBOL_SOURCES:
+            entry = data.get(kind)
+            if isinstance(entry, dict) and isinstance(entry.get("symbols"), list):
+                directory[kind] = sorted(entry["symbols"])
+                fetched_at[kind] = float(entry["fetched_at"])
+        return directory, fetched_at
+    except Exception:
+        # ถ้าไฟล์พัง/อ่านไม่ได้ ให้ดึงใหม่
+        return {}, {}
+
+def stale_symbol_sources(fetched_at: dict[str, float]) -> list[str]:
+    """Return the symbol sources that are missing or older than SYMBOLS_TTL."""
+    now = time.time()
+    return [kind for kind in SYMBOL_SOURCES if now - fetched_at.get(kind, 0) >= SYMBOLS_TTL]
+
+def update_symbol_directory(directory: dict[str, list[str]], fetched_at: dict[str, float], kinds: list[str]) -> None:
+    """Re-fetch the given symbol sources, update directory in place and save it."""
+    updated = False
+    for kind in kinds:
+        try:
+            symbols = SYMBOL_SOURCES[kind]()
+        except Exception:
+            # ดึงไม่ได้ก็ใช้ของเดิมใน cache ไปก่อน แล้วลองใหม่ครั้งหน้า
+            continue
+        if symbols:
+            directory[kind] = sorted(set(symbols))
+            fetched_at[kind] = time.time()
+            updated = True
+
+    if not updated:
+        return
+
+    with SYMBOLS_FILE.open("w", encoding="utf-8") as f:
+        json.dump({
+            kind: {"fetched_at": fetched_at[kind], "symbols": directory[kind]}
+            for kind in directory if kind in fetched_at
+        }, f)
+
+def complete_prefix(words: list[str], prefix: str, limit: int = 200) -> list[str]:
+    """Return up to limit entries of a sorted list that start with prefix (binary search)."""
+    matches = []
+    idx = bisect.bisect_left(words, prefix)
+    while idx < len(words) and len(matches) < limit and words[idx].startswith(prefix):
+        matches.append(words[idx])
+        idx += 1
+    return matches
+
+def shell_candidates(directory: dict[str, list[str]], commands: list[str], line: str, text: str) -> list[str]:
+    """Work out Tab-completion candidates for the word being typed in the shell."""
+    words = line.split()
+    # ตำแหน่งคำที่กำลังพิมพ์ (0 = ชื่อคำสั่ง)
+    pos = len(words) if not words or line.endswith(" ") else len(words) - 1
+    if pos == 0:
+        return complete_prefix(commands, text.lower())
+
+    command = words[0].lower()
+    if command == "help" and pos == 1:
+        return complete_prefix([c for c in commands if c not in ("exit", "help", "quit")], text.lower())
+    previous = words[pos - 1]
+    if previous == "--sort" and command == "crypto":
+        return complete_prefix(sorted(CRYPTO_SORT_KEYS), text.lower())
+    if previous == "--category" and command == "news":
+        return complete_prefix(NEWS_CATEGORIES, text.lower())
+    if text.startswith("-"):
+        return []
+
+    # นับเฉพาะ argument (ข้าม option และค่าของ option)
+    args = []
+    skip = False
+    for word in words[1:pos]:
+        if skip:
+            skip = False
+        elif word.startswith("-"):
+            skip = word in ("--n", "--sort", "--category")
+        else:
+            args.append(word.lower())
+
+    stocks = directory.get("stocks", [])
+    if command in ("stock", "overview") and not args:
+        return complete_prefix(stocks, text.upper())
+    if command == "crypto" and not args:
+        return complete_prefix(["top", "trending"], text.lower()) + complete_prefix(directory.get("coins", []), text.lower())
+    if command == "forex" and len(args) < 2:
+        return complete_prefix(directory.get("currencies", []), text.upper())
+    if command == "watchlist":
+        if not args:
+            return complete_prefix(["add", "remove", "show"], text.lower())
+        if len(args) == 1 and args[0] == "add":
+            return complete_prefix(stocks, text.upper())
+        if len(args) == 1 and args[0] == "remove":
+            return complete_prefix(sorted(load_watchlist()), text.upper())
+    return []
+
 # Top 20 Companies by Market Cap
 @app.command(name="list")
 def show_list():
@@ -85,7 +562,7 @@ def show_list():
         }
 
         try:
-            response = requests.get(url, params=params).json()
+            response = session.get(url, params=params).json()
             
             # เช็คว่าติด Limit หรือไม่ (Alpha Vantage จะส่ง message มาบอก)
             if "Note" in response or "Information" in response:
@@ -141,7 +618,7 @@ def stock(symbol: str, plot: bool = typer.Option(False, "--plot", help="Show 30-
         url = f"https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol={symbol}&apikey={api_key}"
         
         try:
-            response = requests.get(url).json()
+            response = session.get(url).json()
             data = response.get("Time Series (Daily)", {})
             
             if not data:
@@ -169,7 +646,7 @@ def stock(symbol: str, plot: bool = typer.Option(False, "--plot", help="Show 30-
         url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={api_key}"
         
         try:
-            response = requests.get(url).json()
+            response = session.get(url).json()
             data = response.get("Global Quote", {})
             
             if not data:
@@ -195,25 +672,39 @@ def stock(symbol: str, plot: bool = typer.Option(False, "--plot", help="Show 30-
 def crypto(
     option: str = typer.Argument(
         ..., 
-        metavar="coin or 'trending'", 
+        metavar="coin, 'trending' or 'top'",
         help="Choose one of the following:\n\n"
              "1. coin: Enter coin name (e.g. bitcoin) for price.\n\n"
-             "2. 'trending': Type 'trending' to see Top-15 list."
-    )
+             "2. 'trending': Type 'trending' to see Top-15 list.\n\n"
+             "3. 'top': Type 'top' to scan the Top-N coins by market cap."
+    ),
+    n: int = typer.Option(100, "--n", help="Number of coins to scan with 'top', e.g. 1000"),
+    sort: str = typer.Option("market_cap", "--sort", help="Sort 'top' by: market_cap, volume, change"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore the local 'top' snapshot and re-scan"),
 ):
     """
-    [Crypto] Get crypto price & market cap or see trending coins. Use --help for options.
+    [Crypto] Get crypto price & market cap or see trending / top coins. Use --help for options.
+    Example: python app.py crypto top --n 1000 --sort volume
     """
     # Recieve option from user
     option = option.lower()
 
+    # scan top-N coins by market cap
+    if option == "top":
+        show_crypto_top(n, sort, refresh)
+        return
+
+    # option ของ top ใช้กับ coin/trending ไม่ได้
+    if n != 100 or sort != "market_cap" or refresh:
+        console.print("[yellow]⚠️  --n, --sort and --refresh only apply to 'crypto top'; ignoring them.[/yellow]")
+
     # see trending coins
     if option == "trending":
         url = "https://api.coingecko.com/api/v3/search/trending"
         console.print("[yellow]Fetching top-15 trending coins...[/yellow]")
         
         try:
-            response = requests.get(url)
+            response = session.get(url)
             data = response.json()
             coins = data.get("coins", [])
 
@@ -263,7 +754,7 @@ def crypto(
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = session.get(url, params=params)
         data = response.json()
 
         if not data:
@@ -302,7 +793,7 @@ def news(category: str = typer.Option("business", "--category", help="Choose cat
     Example: python app.py news --category technology
     """
     # 1. รายชื่อหมวดหมู่ที่ถูกต้อง
-    valid_categories = ["business", "entertainment", "general", "health", "science", "sports", "technology"]
+    valid_categories = NEWS_CATEGORIES
 
     # 2. ตรวจสอบว่าผู้ใช้พิมพ์หมวดหมู่ถูกไหม
     if category not in valid_categories:
@@ -320,7 +811,7 @@ def news(category: str = typer.Option("business", "--category", help="Choose cat
     url = f"https://newsapi.org/v2/top-headlines?category={category}&language=en&apiKey={api_key}"
 
     try:
-        response = requests.get(url).json()
+        response = session.get(url).json()
 
         # เช็คว่า API ส่ง Error กลับมาไหม
         if response.get("status") == "error":
@@ -390,7 +881,7 @@ def forex(
     }
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = session.get(url, params=params, timeout=10)
         data = resp.json()
 
         key = "Realtime Currency Exchange Rate"
@@ -421,7 +912,7 @@ def forex(
                 "outputsize": "compact",
                 "apikey": api_key,
             }
-            daily_resp = requests.get(daily_url, params=daily_params, timeout=10).json()
+            daily_resp = session.get(daily_url, params=daily_params, timeout=10).json()
             ts = daily_resp.get("Time Series FX (Daily)", {})
             dates = sorted(ts.keys(), reverse=True)
 
@@ -510,7 +1001,7 @@ def watchlist(
 
         for sym in symbols:
             url = "https://www.alphavantage.co/query"
-            resp = requests.get(url, params={
+            resp = session.get(url, params={
                 "function": "GLOBAL_QUOTE",
                 "symbol": sym,
                 "apikey": api_key,
@@ -610,7 +1101,7 @@ def search(keyword: str):
     url = f"https://newsapi.org/v2/everything?q={keyword}&sortBy=publishedAt&language=en&apiKey={api_key}"
 
     try:
-        response = requests.get(url).json()
+        response = session.get(url).json()
         articles = response.get("articles", [])
 
         if not articles:
@@ -650,7 +1141,7 @@ def overview(symbol: str):
     url = f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={symbol}&apikey={api_key}"
 
     try:
-        data = requests.get(url).json()
+        data = session.get(url).json()
         if not data:
             console.print(f"[red]No data found for {symbol}.[/red]")
             return
@@ -672,6 +1163,104 @@ def overview(symbol: str):
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
+# โหมด shell: รันทุกคำสั่งใน process เดียว พร้อม history และ Tab-completion
+@app.command()
+def shell():
+    """
+    [Shell] Interactive mode with history and Tab-completion for tickers, coins & currencies.
+    Example: python app.py shell
+    """
+    try:
+        import readline
+    except ImportError:
+        # Windows ไม่มี readline ให้ใช้งานแบบไม่มี completion
+        readline = None
+
+    directory, fetched_at = load_symbol_directory()
+    stale = stale_symbol_sources(fetched_at)
+    if stale:
+        # โหลด symbol directory เบื้องหลัง ระหว่างนี้ใช้ cache เดิมไปก่อน
+        console.print("[dim]Updating symbol directory in the background...[/dim]")
+        threading.Thread(target=update_symbol_directory, args=(directory, fetched_at, stale), daemon=True).start()
+
+    # สร้าง click command ครั้งเดียว โดยซ่อน shell และ option ติดตั้ง completion ของ bash/zsh
+    cli = typer.main.get_command(app)
+    cli.commands.pop("shell", None)
+    cli.params = [p for p in cli.params if p.name not in ("install_completion", "show_completion")]
+    commands = sorted([*cli.commands, "exit", "help", "quit"])
+
+    if readline is not None:
+        matches: list[str] = []
+
+        def completer(text: str, state: int) -> str | None:
+            nonlocal matches
+            if state == 0:
+                matches = shell_candidates(directory, commands, readline.get_line_buffer(), text)
+            return matches[state] if state < len(matches) else None
+
+        readline.set_completer(completer)
+        readline.set_completer_delims(" \t\n")  # coin id มีขีด เช่น usd-coin
+        if "libedit" in (readline.__doc__ or ""):
+            # Python ของ macOS ใช้ libedit แทน GNU readline
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        readline.set_history_length(1000)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+
+    console.print("[bold green]InvestCLI shell[/bold green] [dim](Tab to complete, 'help' for commands, 'exit' to quit)[/dim]")
+
+    try:
+        while True:
+            try:
+                line = input("investcli> ").strip()
+            except EOFError:
+                console.print()
+                break
+            except KeyboardInterrupt:
+                console.print()
+                continue
+
+            if not line:
+                continue
+            if line in ("exit", "quit"):
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                continue
+
+            # help / help <command>
+            if args[0] == "help":
+                args = [*args[1:2], "--help"]
+
+            if args[0] == "shell":
+                console.print("[yellow]Already in shell[/yellow]")
+                continue
+
+            try:
+                cli.main(args=args, prog_name="investcli", standalone_mode=False)
+            except click.exceptions.ClickException as e:
+                e.show()
+            except (click.exceptions.Abort, KeyboardInterrupt):
+                console.print("[red]Aborted[/red]")
+            except SystemExit:
+                pass
+            except Exception as e:
+                # error จากคำสั่งเดียวต้องไม่ปิด shell ทั้งหมด
+                console.print(f"[red]Error: {e}[/red]")
+    finally:
+        if readline is not None:
+            try:
+                readline.write_history_file(HISTORY_FILE)
+            except OSError:
+                pass
+
 
 if __name__ == "__main__":
     app()